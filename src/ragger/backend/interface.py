@@ -18,11 +18,12 @@ from contextlib import contextmanager
 from enum import Enum, auto
 from pathlib import Path
 from types import TracebackType
-from typing import Optional, Type, Generator, Any, Iterable
+from typing import Optional, Type, Generator, Any, Callable, Iterable, List, Sequence
 
 from ragger.firmware import Firmware
 from ragger.utils import pack_APDU, RAPDU, Crop
-from ragger.logger import get_default_logger, get_apdu_logger, set_apdu_logger_file
+from ragger.logger import (get_default_logger, get_apdu_logger, set_apdu_logger_file,
+                           start_apdu_listener)
 
 
 class RaisePolicy(Enum):
@@ -45,16 +46,18 @@ class BackendInterface(ABC):
         """
         self._firmware = firmware
         self._last_async_response: Optional[RAPDU] = None
+        # Resolved from `raise_policy` and `whitelisted_status`
+        self._must_raise: Callable[[int], bool]
+        self._whitelisted_status = whitelisted_status
         self.raise_policy = RaisePolicy.RAISE_ALL_BUT_0x9000
 
         if log_apdu_file:
             set_apdu_logger_file(log_apdu_file=log_apdu_file)
 
+        start_apdu_listener()
         self.logger = get_default_logger()
         self.apdu_logger = get_apdu_logger()
 
-        self.whitelisted_status = whitelisted_status
-
     @property
     def firmware(self) -> Firmware:
         """
@@ -63,6 +66,48 @@ class BackendInterface(ABC):
         """
         return self._firmware
 
+    @property
+    def raise_policy(self) -> RaisePolicy:
+        """
+        :return: The policy deciding which response statuses raise an
+                 `ExceptionRAPDU`.
+        :rtype: RaisePolicy
+        """
+        return self._raise_policy
+
+    @raise_policy.setter
+    def raise_policy(self, policy: RaisePolicy) -> None:
+        self._raise_policy = policy
+        self._update_must_raise()
+
+    @property
+    def whitelisted_status(self) -> Iterable:
+        """
+        :return: The statuses not raising an `ExceptionRAPDU` with the
+                 `RAISE_CUSTOM` policy.
+        :rtype: Iterable
+        """
+        return self._whitelisted_status
+
+    @whitelisted_status.setter
+    def whitelisted_status(self, whitelisted_status: Iterable) -> None:
+        self._whitelisted_status = whitelisted_status
+        self._update_must_raise()
+
+    def _update_must_raise(self) -> None:
+        # Resolved once here rather than on every received RAPDU. The
+        # functions do not capture `self`, which would create a reference cycle
+        policy = self._raise_policy
+        if policy == RaisePolicy.RAISE_NOTHING:
+            self._must_raise = lambda status: False
+        elif policy == RaisePolicy.RAISE_ALL_BUT_0x9000:
+            self._must_raise = lambda status: status != 0x9000
+        elif policy == RaisePolicy.RAISE_ALL:
+            self._must_raise = lambda status: True
+        else:
+            whitelisted_status = self._whitelisted_status
+            self._must_raise = lambda status: status not in whitelisted_status
+
     @property
     def last_async_response(self) -> Optional[RAPDU]:
         """
@@ -97,11 +142,7 @@ class BackendInterface(ABC):
         :return: If the given status is considered valid or not
         :rtype: bool
         """
-        return ((self.raise_policy == RaisePolicy.RAISE_ALL)
-                or ((self.raise_policy == RaisePolicy.RAISE_ALL_BUT_0x9000) and
-                    (rapdu.status != 0x9000))
-                or ((self.raise_policy == RaisePolicy.RAISE_CUSTOM) and
-                    (rapdu.status not in self.whitelisted_status)))
+        return self._must_raise(rapdu.status)
 
     def send(self, cla: int, ins: int, p1: int = 0, p2: int = 0, data: bytes = b"") -> None:
         """
@@ -208,6 +249,28 @@ class BackendInterface(ABC):
         """
         raise NotImplementedError
 
+    def exchange_many(self, apdus: Sequence[bytes]) -> List[RAPDU]:
+        """
+        Sends each of the given APDUs to the backend, and receives their
+        responses.
+
+        Every part of each APDU (including length) are the caller's
+        responsibility. This is a convenience loop calling `exchange_raw` on
+        each APDU in turn: no APDU is sent before the response of the previous
+        one has been received.
+
+        :param apdus: The APDU messages
+        :type apdus: Sequence[bytes]
+
+        :raises ExceptionRAPDU: If the `raises` attribute is True, this method
+                                  will raise if the backend returns a status code
+                                  not registered as a `valid_statuses`
+
+        :return: The APDU responses, in the same order as the given APDUs
+        :rtype: List[RAPDU]
+        """
+        return [self.exchange_raw(apdu) for apdu in apdus]
+
     @contextmanager
     def exchange_async(self,
                        cla: int,
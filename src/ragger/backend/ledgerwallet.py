@@ -13,36 +13,45 @@
    See the License for the specific language governing permissions and
    limitations under the License.
 """
+import logging
 from contextlib import contextmanager
+from struct import Struct
 from time import sleep
-from typing import Generator, Optional
+from typing import Any, Callable, Generator, NoReturn, Optional, Tuple
 
-from ledgerwallet.client import LedgerClient, CommException
+from ledgerwallet.client import LedgerClient, CommException, NoLedgerDeviceException
 from ledgerwallet.transport import HidDevice
 
 from ragger.firmware import Firmware
 from ragger.utils import RAPDU
 from ragger.error import ExceptionRAPDU
+from ragger.logger import LazyHex
 from .physical_backend import PhysicalBackend
 
+# Status word, the last 2 bytes of a response APDU
+_SW_STRUCT = Struct(">H")
 
-def raise_policy_enforcer(function):
+# Delays (in seconds) between LedgerClient creation attempts
+_CONNECTION_RETRY_DELAYS = (0.05, 0.1, 0.2, 0.4)
 
-    def decoration(self: 'LedgerWalletBackend', *args, **kwargs) -> RAPDU:
-        # Catch backend raise
+
+def _create_client() -> LedgerClient:
+    # Give some time for the USB stack to power up and to be enumerated
+    # Might be needed in successive tests where app is exited at the end of the test
+    for delay in _CONNECTION_RETRY_DELAYS:
         try:
-            rapdu: RAPDU = function(self, *args, **kwargs)
-        except CommException as error:
-            rapdu = RAPDU(error.sw, error.data)
+            return LedgerClient()
+        except (NoLedgerDeviceException, OSError):
+            sleep(delay)
+    return LedgerClient()
 
-        self.apdu_logger.debug("<= %s%4x", rapdu.data.hex(), rapdu.status)
 
-        if self.is_raise_required(rapdu):
-            raise ExceptionRAPDU(rapdu.status, rapdu.data)
-        else:
-            return rapdu
-
-    return decoration
+def _parse_response(raw_result: bytes) -> Tuple[int, bytes]:
+    # Returns the status word and the payload of a raw response
+    if len(raw_result) >= 2:
+        return _SW_STRUCT.unpack_from(raw_result, len(raw_result) - 2)[0], raw_result[:-2]
+    # Truncated response (closed transport for instance): no complete status word
+    return int.from_bytes(raw_result, "big"), b""
 
 
 class LedgerWalletBackend(PhysicalBackend):
@@ -50,52 +59,97 @@ class LedgerWalletBackend(PhysicalBackend):
     def __init__(self, firmware: Firmware, *args, with_gui: bool = False, **kwargs):
         super().__init__(firmware, *args, with_gui=with_gui, **kwargs)
         self._client: Optional[LedgerClient] = None
+        # Client methods used on each APDU, bound once the client is created
+        self._write: Callable[[bytes], None]
+        self._read: Callable[..., bytes]
+        self._raw_exchange: Callable[[bytes], bytes]
+        self._is_hid: bool
+        self._unbind_client()
 
     def __enter__(self) -> "LedgerWalletBackend":
         self.logger.info(f"Starting {self.__class__.__name__} stream")
-        try:
-            self._client = LedgerClient()
-        except Exception:
-            # Give some time for the USB stack to power up and to be enumerated
-            # Might be needed in successive tests where app is exited at the end of the test
-            sleep(1)
-            self._client = LedgerClient()
+        self._client = _create_client()
+        self._bind_client()
         return self
 
+    def _bind_client(self) -> None:
+        assert self._client is not None
+        self._write = self._client.device.write
+        self._read = self._client.device.read
+        # LedgerClient.raw_exchange only wraps the device exchange with eagerly hex-encoded debug
+        # logs, which would duplicate the APDU logger ones
+        self._raw_exchange = self._client.device.exchange
+        # TODO: remove this checked with LedgerWallet > 0.1.3
+        self._is_hid = isinstance(self._client.device, HidDevice)
+
+    def _unbind_client(self) -> None:
+        self._write = self._not_connected
+        self._read = self._not_connected
+        self._raw_exchange = self._not_connected
+        self._is_hid = False
+
+    def _not_connected(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise RuntimeError(f"{self.__class__.__name__} is not started, use it as a context manager")
+
     def __exit__(self, *args):
         super().__exit__(*args)
         assert self._client is not None
         self._client.close()
+        self._unbind_client()
 
     def handle_usb_reset(self) -> None:
         self.logger.info(f"Re-starting {self.__class__.__name__} stream")
-        self.__exit__()
-        self.__enter__()
+        # Only the client is re-created: the GUI (if any) is kept alive
+        assert self._client is not None
+        self._client.close()
+        self._unbind_client()
+        self._client = _create_client()
+        self._bind_client()
 
     def send_raw(self, data: bytes = b"") -> None:
-        self.apdu_logger.debug("=> %s", data.hex())
-        assert self._client is not None
-        self._client.device.write(data)
+        if self.apdu_logger.isEnabledFor(logging.DEBUG):
+            self.apdu_logger.debug("=> %s", LazyHex(data))
+        self._write(data)
 
-    @raise_policy_enforcer
     def receive(self) -> RAPDU:
-        assert self._client is not None
-        # TODO: remove this checked with LedgerWallet > 0.1.3
-        if isinstance(self._client.device, HidDevice):
-            raw_result = self._client.device.read(1000)
+        # Catch backend raise
+        try:
+            raw_result = self._read(1000) if self._is_hid else self._read()
+            status, payload = _parse_response(raw_result)
+        except CommException as error:
+            status, payload = error.sw, error.data or b""
+            if self.apdu_logger.isEnabledFor(logging.DEBUG):
+                # The raw response is the payload followed by the status word
+                self.apdu_logger.debug("<= %s%04x", LazyHex(payload), status)
         else:
-            raw_result = self._client.device.read()
-        status, payload = int.from_bytes(raw_result[-2:], "big"), raw_result[:-2] or b""
-        result = RAPDU(status, payload)
-        return result
+            if self.apdu_logger.isEnabledFor(logging.DEBUG):
+                self.apdu_logger.debug("<= %s", LazyHex(raw_result))
+
+        # The RAPDU is only built when it is returned
+        if self._must_raise(status):
+            raise ExceptionRAPDU(status, payload)
+        return RAPDU(status, payload)
 
-    @raise_policy_enforcer
     def exchange_raw(self, data: bytes = b"", tick_timeout: int = 0) -> RAPDU:
-        self.apdu_logger.debug("=> %s", data.hex())
-        assert self._client is not None
-        raw_result = self._client.raw_exchange(data)
-        result = RAPDU(int.from_bytes(raw_result[-2:], "big"), raw_result[:-2] or b"")
-        return result
+        if self.apdu_logger.isEnabledFor(logging.DEBUG):
+            self.apdu_logger.debug("=> %s", LazyHex(data))
+        # Catch backend raise
+        try:
+            raw_result = self._raw_exchange(data)
+            status, payload = _parse_response(raw_result)
+        except CommException as error:
+            status, payload = error.sw, error.data or b""
+            if self.apdu_logger.isEnabledFor(logging.DEBUG):
+                # The raw response is the payload followed by the status word
+                self.apdu_logger.debug("<= %s%04x", LazyHex(payload), status)
+        else:
+            if self.apdu_logger.isEnabledFor(logging.DEBUG):
+                self.apdu_logger.debug("<= %s", LazyHex(raw_result))
+
+        # The RAPDU is only built when it is returned
+        if self._must_raise(status):
+            raise ExceptionRAPDU(status, payload)
+        return RAPDU(status, payload)
 
     @contextmanager
     def exchange_async_raw(self, data: bytes = b"") -> Generator[None, None, None]:
@@ -32,6 +32,9 @@ class PhysicalBackend(BackendInterface):
         super().__init__(firmware, *args, **kwargs)
         self._ui: Optional[RaggerGUI] = RaggerGUI(device=firmware.name) if with_gui else None
         self._last_valid_snap_path: Optional[Path] = None
+        # OCR result of the last snapshot checked by `compare_screen_with_text`
+        self._ocr_snap_path: Optional[Path] = None
+        self._ocr_snap_text: List[str] = list()
 
     def __exit__(self,
                  exc_type: Optional[Type[BaseException]] = None,
@@ -107,19 +110,26 @@ class PhysicalBackend(BackendInterface):
             return True
         self.init_gui()
         if self._last_valid_snap_path:
-            image = Image.open(self._last_valid_snap_path)
+            for item in self._get_snap_text(self._last_valid_snap_path):
+                if text in item:
+                    return True
+            return False
+        else:
+            return self._ui.check_text(text)
+
+    def _get_snap_text(self, snap_path: Path) -> List[str]:
+        # The OCR is costly, and the same snapshot is usually checked several
+        # times (for instance when waiting for a text), so its result is kept
+        if snap_path != self._ocr_snap_path:
+            image = Image.open(snap_path)
             # Nano (s,sp,x) snapshots are white/blue text on black background,
             # tesseract cannot do OCR on these. Invert image so it has
             # dark text on white background.
             if self.firmware.is_nano:
                 image = ImageOps.invert(image)
-            data = image_to_data(image, output_type=Output.DICT)
-            for item in range(len(data["text"])):
-                if text in data["text"][item]:
-                    return True
-            return False
-        else:
-            return self._ui.check_text(text)
+            self._ocr_snap_text = image_to_data(image, output_type=Output.DICT)["text"]
+            self._ocr_snap_path = snap_path
+        return self._ocr_snap_text
 
     def wait_for_screen_change(self, timeout: float = 10.0) -> None:
         return
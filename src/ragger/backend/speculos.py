@@ -58,7 +58,7 @@ def raise_policy_enforcer(function):
         except ApduException as error:
             rapdu = RAPDU(error.sw, error.data)
 
-        self.apdu_logger.info("<= %s%4x", rapdu.data.hex(), rapdu.status)
+        self.apdu_logger.info("<= %s%04x", rapdu.data.hex(), rapdu.status)
 
         if self.is_raise_required(rapdu):
             raise ExceptionRAPDU(rapdu.status, rapdu.data)
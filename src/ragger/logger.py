@@ -16,11 +16,131 @@
 
 import atexit
 import logging
+import os
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from queue import SimpleQueue
+from typing import List, Optional, Tuple
 
 DEFAULT_FORMAT = '[%(asctime)s][%(levelname)s] %(name)s - %(message)s'
 
+# Handlers of the APDU logger: attached to the logger itself until `start_apdu_listener` is
+# called, then run by `_apdu_listener`
+_apdu_handlers: List[logging.Handler] = []
+_apdu_listener: Optional[QueueListener] = None
+_apdu_queue_handler: Optional[QueueHandler] = None
+
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for an in-process queue: records are enqueued untouched, so that
+    their formatting happens on the listener thread instead of the APDU exchange one.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class BufferedApduFileHandler(logging.FileHandler):
+    """
+    FileHandler which does not flush the file after each record: lines are kept in a large
+    buffer, written at most ``FLUSH_INTERVAL`` seconds after being logged, or immediately for
+    WARNING (and above) records.
+    """
+    BUFFER_SIZE = 1 << 16
+    FLUSH_INTERVAL = 5.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._flush_timer: Optional[threading.Timer] = None
+        # Only set by FileHandler from Python 3.11
+        self._closed = False
+
+    def _open(self):
+        # `_builtin_open` and `errors` are not defined by FileHandler on older Python versions
+        open_func = getattr(self, "_builtin_open", open)
+        return open_func(self.baseFilename,
+                         self.mode,
+                         buffering=self.BUFFER_SIZE,
+                         encoding=self.encoding,
+                         errors=getattr(self, "errors", None))
+
+    def emit(self, record: logging.LogRecord):
+        if self.stream is None:
+            # As in FileHandler: a closed 'w' file is not re-opened, which would truncate it
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if not self.stream:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        if record.levelno >= logging.WARNING:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self._timed_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _timed_flush(self):
+        self.acquire()
+        try:
+            self._flush_timer = None
+            self.flush()
+        finally:
+            self.release()
+
+    def close(self):
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._closed = True
+        finally:
+            self.release()
+        super().close()
+
+
+class _Formatter(logging.Formatter):
+    """
+    Formatter reusing the date part of ``asctime`` for every record logged during the same second,
+    instead of calling ``time.strftime`` on each of them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(second))
+            self._time_cache = (second, formatted)
+        if self.default_msec_format:
+            formatted = self.default_msec_format % (formatted, record.msecs)
+        return formatted
+
+
+class LazyHex:
+    """
+    Bytes logging argument, hex-encoded only when (and where) the record is formatted.
+    """
+    __slots__ = ("data", )
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __str__(self) -> str:
+        return self.data.hex()
+
 
 def get_default_logger():
     return logging.getLogger("ragger.logger")
@@ -34,13 +154,80 @@ def get_gui_logger():
     return logging.getLogger("ragger.gui")
 
 
+def _set_apdu_handlers(handlers: List[logging.Handler]):
+    global _apdu_handlers
+    listening = _apdu_listener is not None
+    _stop_apdu_listener()
+    _detach_apdu_handlers()
+    _apdu_handlers = handlers
+    apdu_logger = get_apdu_logger()
+    if listening:
+        start_apdu_listener()
+    else:
+        for handler in handlers:
+            apdu_logger.addHandler(handler)
+
+
+def start_apdu_listener():
+    """
+    Moves the APDU handlers (stream, file) to a QueueListener thread: from then on, the APDU
+    logger only pushes records into a queue, out of the exchange hot path.
+
+    This is done on backend creation, so that importing ragger does not start a thread. As the
+    APDU records are then handled asynchronously, their output may be interleaved differently with
+    the output of the other loggers.
+    """
+    global _apdu_listener, _apdu_queue_handler
+    if _apdu_listener is not None:
+        return
+    _detach_apdu_handlers()
+    queue: SimpleQueue = SimpleQueue()
+    _apdu_queue_handler = _LocalQueueHandler(queue)
+    get_apdu_logger().addHandler(_apdu_queue_handler)
+    _apdu_listener = QueueListener(queue, *_apdu_handlers, respect_handler_level=True)
+    _apdu_listener.start()
+
+
+def _detach_apdu_handlers():
+    # Only ragger's own handlers are removed: the ones added by users are kept
+    global _apdu_queue_handler
+    apdu_logger = get_apdu_logger()
+    for handler in _apdu_handlers:
+        apdu_logger.removeHandler(handler)
+    if _apdu_queue_handler is not None:
+        apdu_logger.removeHandler(_apdu_queue_handler)
+        _apdu_queue_handler = None
+
+
+def _stop_apdu_listener():
+    global _apdu_listener
+    listener, _apdu_listener = _apdu_listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def flush_apdu_logger():
+    """
+    Waits for every pending APDU log record to be handled, then flushes the APDU handlers.
+    """
+    if _apdu_listener is not None:
+        # Stopping the listener processes the remaining records
+        _apdu_listener.stop()
+        _apdu_listener.start()
+    for handler in _apdu_handlers:
+        handler.flush()
+
+
 def _init_logger(logger: logging.Logger, format: Optional[str]):
     format = format or DEFAULT_FORMAT
     logger.handlers.clear()
     logger.setLevel(level=logging.DEBUG)
     handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter(format))
-    logger.addHandler(handler)
+    handler.setFormatter(_Formatter(format))
+    if logger is get_apdu_logger():
+        _set_apdu_handlers([handler])
+    else:
+        logger.addHandler(handler)
 
 
 def init_loggers(format: Optional[str] = None):
@@ -49,20 +236,31 @@ def init_loggers(format: Optional[str] = None):
 
 
 def set_apdu_logger_file(log_apdu_file: Path):
-    apdu_logger = get_apdu_logger()
+    handlers = list(_apdu_handlers)
 
     # Only one file handler supported
-    for handler in apdu_logger.handlers:
-        if isinstance(handler, logging.FileHandler):
-            apdu_logger.removeHandler(handler)
+    file_handlers = [handler for handler in handlers if isinstance(handler, logging.FileHandler)]
+    if any(handler.baseFilename == os.path.abspath(log_apdu_file) for handler in file_handlers):
+        # Already logging into this file (several backends in the same session): re-opening it
+        # would truncate it
+        return
+    handlers = [handler for handler in handlers if handler not in file_handlers]
 
-    apdu_handler = logging.FileHandler(filename=log_apdu_file, mode='w', delay=True)
+    apdu_handler = BufferedApduFileHandler(filename=log_apdu_file, mode='w', delay=True)
     apdu_handler.setFormatter(logging.Formatter('%(message)s'))
-    apdu_logger.addHandler(apdu_handler)
+    handlers.append(apdu_handler)
+    _set_apdu_handlers(handlers)
+
+    for handler in file_handlers:
+        handler.close()
+
+
+def _cleanup():
+    _stop_apdu_listener()
+    for handler in _apdu_handlers:
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
 
-    def cleanup():
-        for handler in apdu_logger.handlers:
-            if isinstance(handler, logging.FileHandler):
-                handler.close()
 
-    atexit.register(cleanup)
+# Pending APDU records are written before the interpreter exits
+atexit.register(_cleanup)
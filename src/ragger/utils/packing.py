@@ -13,8 +13,11 @@
    See the License for the specific language governing permissions and
    limitations under the License.
 """
-from struct import pack
+from struct import Struct
+
+# CLA, INS, P1, P2, Lc
+_APDU_HEADER_STRUCT = Struct(">BBBBB")
 
 
 def pack_APDU(cla: int, ins: int, p1: int = 0, p2: int = 0, data: bytes = b"") -> bytes:
-    return pack(">BBBBB", cla, ins, p1, p2, len(data)) + data
+    return _APDU_HEADER_STRUCT.pack(cla, ins, p1, p2, len(data)) + data
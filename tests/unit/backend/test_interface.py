@@ -1,5 +1,6 @@
 import struct
 import tempfile
+import weakref
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import MagicMock
@@ -8,6 +9,8 @@ from ragger.error import ExceptionRAPDU
 from ragger.backend import BackendInterface
 from ragger.backend import RaisePolicy
 from ragger.firmware.structs import Firmware
+from ragger.utils import RAPDU
+from ragger.logger import LazyHex, flush_apdu_logger
 
 
 class DummyBackend(BackendInterface):
@@ -34,7 +37,7 @@ class DummyBackend(BackendInterface):
     def exchange_async_raw(self, *args, **kwargs):
         return self.mock.exchange_async_raw(*args, **kwargs)
 
-    def exchange_raw(self, data: bytes, tick_timeout: int):
+    def exchange_raw(self, data: bytes, tick_timeout: int = 5 * 60 * 10):
         return self.mock.exchange_raw(data, tick_timeout)
 
     def receive(self):
@@ -95,6 +98,32 @@ class TestBackendInterface(TestCase):
         # Default value
         self.assertEqual(self.backend.raise_policy, RaisePolicy.RAISE_ALL_BUT_0x9000)
 
+    def test_is_raise_required(self):
+        ok, nok = RAPDU(0x9000, b""), RAPDU(0x6985, b"")
+        self.backend.raise_policy = RaisePolicy.RAISE_NOTHING
+        self.assertFalse(self.backend.is_raise_required(ok))
+        self.assertFalse(self.backend.is_raise_required(nok))
+        self.backend.raise_policy = RaisePolicy.RAISE_ALL_BUT_0x9000
+        self.assertFalse(self.backend.is_raise_required(ok))
+        self.assertTrue(self.backend.is_raise_required(nok))
+        self.backend.raise_policy = RaisePolicy.RAISE_ALL
+        self.assertTrue(self.backend.is_raise_required(ok))
+        self.assertTrue(self.backend.is_raise_required(nok))
+        self.backend.raise_policy = RaisePolicy.RAISE_CUSTOM
+        self.backend.whitelisted_status = (0x9000, 0x6985)
+        self.assertFalse(self.backend.is_raise_required(ok))
+        self.assertFalse(self.backend.is_raise_required(nok))
+        self.backend.whitelisted_status = (0x9000, )
+        self.assertTrue(self.backend.is_raise_required(nok))
+
+    def test_no_reference_cycle(self):
+        for policy in RaisePolicy:
+            backend = DummyBackend(firmware=self.firmware, whitelisted_status=(0x9000, ))
+            backend.raise_policy = policy
+            reference = weakref.ref(backend)
+            del backend
+            self.assertIsNone(reference())
+
     def test_send(self):
         cla, ins, p1, p2 = 1, 2, 3, 4
         expected = struct.pack(">BBBBB", cla, ins, p1, p2, 0)
@@ -112,6 +141,14 @@ class TestBackendInterface(TestCase):
         self.assertEqual(self.backend.mock.exchange_raw.call_args, ((expected, 5 * 60 * 10), ))
         self.assertEqual(result, self.backend.mock.exchange_raw())
 
+    def test_exchange_many(self):
+        apdus = [struct.pack(">BBBBB", 1, 2, 3, 4, 0), struct.pack(">BBBBB", 1, 2, 3, 5, 0)]
+        result = self.backend.exchange_many(apdus)
+        self.assertEqual(self.backend.mock.exchange_raw.call_count, len(apdus))
+        self.assertEqual(self.backend.mock.exchange_raw.call_args_list,
+                         [((apdu, 5 * 60 * 10), ) for apdu in apdus])
+        self.assertEqual(result, [self.backend.mock.exchange_raw()] * len(apdus))
+
     def test_exchange_async(self):
         cla, ins, p1, p2 = 1, 2, 3, 4
         expected = struct.pack(">BBBBB", cla, ins, p1, p2, 0)
@@ -132,6 +169,30 @@ class TestBackendInterfaceLogging(TestCase):
             ref_lines = ["Test logging", "hello world", "Lorem Ipsum"]
             for l in ref_lines:
                 self.backend.apdu_logger.debug(l)
+            flush_apdu_logger()
+            with open(test_file, mode='r') as fp:
+                read_lines = [l.strip() for l in fp.readlines()]
+                self.assertEqual(read_lines, ref_lines)
+
+    def test_log_apdu_lazy_hex(self):
+        self.firmware = Firmware.NANOS
+        with tempfile.TemporaryDirectory() as td:
+            test_file = (Path(td) / "test_log_file.log").resolve()
+            self.backend = DummyBackend(firmware=self.firmware, log_apdu_file=test_file)
+            self.backend.apdu_logger.debug("=> %s", LazyHex(bytes.fromhex("e0010000")))
+            flush_apdu_logger()
+            with open(test_file, mode='r') as fp:
+                self.assertEqual(fp.read().strip(), "=> e0010000")
+
+    def test_log_apdu_same_file(self):
+        self.firmware = Firmware.NANOS
+        with tempfile.TemporaryDirectory() as td:
+            test_file = (Path(td) / "test_log_file.log").resolve()
+            ref_lines = ["first backend", "second backend"]
+            for l in ref_lines:
+                backend = DummyBackend(firmware=self.firmware, log_apdu_file=test_file)
+                backend.apdu_logger.debug(l)
+            flush_apdu_logger()
             with open(test_file, mode='r') as fp:
                 read_lines = [l.strip() for l in fp.readlines()]
                 self.assertEqual(read_lines, ref_lines)
@@ -2,6 +2,8 @@ from typing import Optional
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
+from ledgerwallet.client import CommException, NoLedgerDeviceException
+
 from ragger.firmware import Firmware
 from ragger.error import ExceptionRAPDU
 from ragger.utils import RAPDU
@@ -35,6 +37,45 @@ class TestLedgerWalletBackend(TestCase):
             with self.backend:
                 self.assertIsNone(self.backend.send_raw(b""))
 
+    def test_contextmanager_retries(self):
+        with patch("ledgerwallet.client.enumerate_devices") as devices, \
+                patch("ragger.backend.ledgerwallet.sleep") as sleep:
+            devices.side_effect = [[], [], [self.device]]
+            with self.backend:
+                pass
+        self.assertEqual(devices.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_contextmanager_no_device(self):
+        with patch("ledgerwallet.client.enumerate_devices") as devices, \
+                patch("ragger.backend.ledgerwallet.sleep") as sleep:
+            devices.return_value = []
+            with self.assertRaises(NoLedgerDeviceException):
+                with self.backend:
+                    pass
+        # Shorter than the former single 1 s wait
+        self.assertAlmostEqual(sum(call.args[0] for call in sleep.call_args_list), 0.75)
+
+    def test_handle_usb_reset(self):
+        new_device = MagicMock()
+        with patch("ledgerwallet.client.enumerate_devices") as devices:
+            devices.return_value = [self.device]
+            with self.backend:
+                devices.return_value = [new_device]
+                self.backend.handle_usb_reset()
+                self.assertTrue(self.device.close.called)
+                self.backend.send_raw(b"")
+        self.assertFalse(self.device.write.called)
+        self.assertTrue(new_device.write.called)
+
+    def test_not_started(self):
+        with self.assertRaises(RuntimeError):
+            self.backend.send_raw(b"")
+        with self.assertRaises(RuntimeError):
+            self.backend.receive()
+        with self.assertRaises(RuntimeError):
+            self.backend.exchange_raw(b"")
+
     def test_receive_ok(self):
         status, payload = 0x9000, b"something"
         self.device.read.return_value = payload + bytes.fromhex(f"{status:x}")
@@ -44,6 +85,30 @@ class TestLedgerWalletBackend(TestCase):
                 rapdu = self.backend.receive()
         self.check_rapdu(rapdu, payload=payload)
 
+    def test_receive_truncated(self):
+        for raw_result, status in ((b"", 0), (b"\x6a", 0x6a)):
+            self.device.read.return_value = raw_result
+            with patch("ledgerwallet.client.enumerate_devices") as devices:
+                devices.return_value = [self.device]
+                with self.backend:
+                    self.backend.raise_policy = RaisePolicy.RAISE_NOTHING
+                    rapdu = self.backend.receive()
+                    self.check_rapdu(rapdu, status=status, payload=b"")
+                    self.backend.raise_policy = RaisePolicy.RAISE_ALL_BUT_0x9000
+                    with self.assertRaises(ExceptionRAPDU) as error:
+                        self.backend.receive()
+            self.assertEqual(error.exception.status, status)
+
+    def test_exchange_raw_truncated(self):
+        for raw_result, status in ((b"", 0), (b"\x6a", 0x6a)):
+            self.device.exchange.return_value = raw_result
+            with patch("ledgerwallet.client.enumerate_devices") as devices:
+                devices.return_value = [self.device]
+                with self.backend:
+                    self.backend.raise_policy = RaisePolicy.RAISE_NOTHING
+                    rapdu = self.backend.exchange_raw(b"")
+            self.check_rapdu(rapdu, status=status, payload=b"")
+
     def test_receive_ok_raises(self):
         status, payload = 0x9000, b"something"
         self.device.read.return_value = payload + bytes.fromhex(f"{status:x}")
@@ -84,6 +149,17 @@ class TestLedgerWalletBackend(TestCase):
                 rapdu = self.backend.exchange_raw(b"")
         self.check_rapdu(rapdu, payload=payload)
 
+    def test_exchange_raw_log(self):
+        status, payload = 0x9000, b"something"
+        self.device.exchange.return_value = payload + bytes.fromhex(f"{status:x}")
+        with patch("ledgerwallet.client.enumerate_devices") as devices:
+            devices.return_value = [self.device]
+            with self.backend:
+                with self.assertLogs(self.backend.apdu_logger, level="DEBUG") as logs:
+                    self.backend.exchange_raw(b"\xe0\x01")
+        self.assertEqual([record.getMessage() for record in logs.records],
+                         ["=> e001", f"<= {payload.hex()}9000"])
+
     def test_exchange_raw_nok_no_raises(self):
         status, payload = 0x8000, b"something"
         self.device.exchange.return_value = payload + bytes.fromhex(f"{status:x}")
@@ -104,6 +180,33 @@ class TestLedgerWalletBackend(TestCase):
                     self.backend.exchange_raw(b"")
         self.assertEqual(error.exception.status, status)
 
+    def test_exchange_many_ok(self):
+        statuses, payload = (0x9000, 0x9001), b"something"
+        self.device.exchange.side_effect = [payload + bytes.fromhex(f"{s:x}") for s in statuses]
+        with patch("ledgerwallet.client.enumerate_devices") as devices:
+            devices.return_value = [self.device]
+            with self.backend:
+                self.backend.raise_policy = RaisePolicy.RAISE_NOTHING
+                rapdus = self.backend.exchange_many([b"first", b"second"])
+        self.assertEqual(self.device.exchange.call_args_list, [((b"first", ), ), ((b"second", ), )])
+        self.assertEqual(len(rapdus), 2)
+        for rapdu, status in zip(rapdus, statuses):
+            self.check_rapdu(rapdu, status=status, payload=payload)
+
+    def test_exchange_raw_comm_exception(self):
+        status, payload = 0x6985, b"error"
+        self.device.exchange.side_effect = CommException("error", sw=status, data=payload)
+        with patch("ledgerwallet.client.enumerate_devices") as devices:
+            devices.return_value = [self.device]
+            with self.backend:
+                with self.assertRaises(ExceptionRAPDU) as error:
+                    self.backend.exchange_raw(b"")
+                self.backend.raise_policy = RaisePolicy.RAISE_NOTHING
+                rapdu = self.backend.exchange_raw(b"")
+        self.assertEqual(error.exception.status, status)
+        self.assertEqual(error.exception.data, payload)
+        self.check_rapdu(rapdu, status=status, payload=payload)
+
     def test_exchange_async_raw_ok(self):
         status, payload = 0x9000, b"something"
         self.device.read.return_value = payload + bytes.fromhex(f"{status:x}")
@@ -1,7 +1,7 @@
 from contextlib import contextmanager
 from typing import Generator
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from ragger.backend import BackendInterface
 from ragger.backend.physical_backend import PhysicalBackend
@@ -126,6 +126,16 @@ class TestPhysicalBackend(TestCase):
         self.assertTrue(self.backend.compare_screen_with_text(text))
         self.assertFalse(self.backend.compare_screen_with_text("this text does not exist here"))
 
+    def test_compare_screen_with_text_with_gui_ocr_cached(self):
+        path = "tests/snapshots/nanos/generic/00000.png"
+        self.backend._last_valid_snap_path = path
+        with patch("ragger.backend.physical_backend.image_to_data") as ocr:
+            ocr.return_value = {"text": ["", "Boilerplate", "is ready"]}
+            self.assertTrue(self.backend.compare_screen_with_text("Boilerplate"))
+            self.assertTrue(self.backend.compare_screen_with_text("ready"))
+            self.assertFalse(self.backend.compare_screen_with_text("this text does not exist here"))
+        self.assertEqual(ocr.call_count, 1)
+
     def test_compare_screen_with_text_with_gui_last_valid_snap_path_does_not_exist(self):
         # mocking the underlying called method
         oracle = MagicMock()
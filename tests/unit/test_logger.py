@@ -0,0 +1,122 @@
+import logging
+import subprocess
+import sys
+import tempfile
+from logging.handlers import QueueHandler
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from ragger.backend import StubBackend
+from ragger.firmware import Firmware
+from ragger.logger import DEFAULT_FORMAT, BufferedApduFileHandler, _Formatter, get_apdu_logger
+
+
+class TestApduListener(TestCase):
+
+    def test_not_started_on_import(self):
+        code = "import threading, ragger; print(threading.active_count())"
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.strip(), b"1")
+
+    def test_started_on_backend_creation(self):
+        StubBackend(Firmware.NANOS)
+        handlers = get_apdu_logger().handlers
+        self.assertEqual(
+            len([handler for handler in handlers if isinstance(handler, QueueHandler)]), 1)
+
+    def test_user_handler_kept(self):
+        code = "\n".join([
+            "import logging, io",
+            "from ragger.backend import StubBackend",
+            "from ragger.firmware import Firmware",
+            "from ragger.logger import get_apdu_logger, flush_apdu_logger",
+            "stream = io.StringIO()",
+            "get_apdu_logger().addHandler(logging.StreamHandler(stream))",
+            "get_apdu_logger().warning('before')",
+            "StubBackend(Firmware.NANOS)",
+            "get_apdu_logger().warning('after')",
+            "flush_apdu_logger()",
+            "print(repr(stream.getvalue()))",
+        ])
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.strip(), b"'before\\nafter\\n'")
+
+
+class TestFormatter(TestCase):
+
+    def record(self, created: float) -> logging.LogRecord:
+        record = logging.LogRecord("test", logging.DEBUG, __file__, 0, "message", None, None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+
+    def test_format_as_logging_formatter(self):
+        # Same second, then across second boundaries
+        times = [1700000000.123, 1700000000.987, 1700000001.001, 1700000001.5, 1700003600.25]
+        for datefmt in (None, "%H:%M:%S"):
+            formatter = _Formatter(DEFAULT_FORMAT, datefmt=datefmt)
+            reference = logging.Formatter(DEFAULT_FORMAT, datefmt=datefmt)
+            for created in times:
+                record = self.record(created)
+                self.assertEqual(formatter.format(record), reference.format(record))
+
+
+class TestBufferedApduFileHandler(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "apdu.log"
+        self.handler = BufferedApduFileHandler(filename=self.path, mode='w', delay=True)
+        self.handler.setFormatter(logging.Formatter('%(message)s'))
+
+    def tearDown(self):
+        self.handler.close()
+        self.directory.cleanup()
+
+    def record(self, message: str, level: int = logging.DEBUG) -> logging.LogRecord:
+        return logging.LogRecord("test", level, __file__, 0, message, None, None)
+
+    def read(self) -> str:
+        return self.path.read_text() if self.path.exists() else ""
+
+    def test_flush_on_timer(self):
+        with patch("ragger.logger.threading.Timer") as timer:
+            self.handler.handle(self.record("first"))
+            self.handler.handle(self.record("second"))
+            # A single timer is started for both records, which stay in the buffer
+            timer.assert_called_once_with(BufferedApduFileHandler.FLUSH_INTERVAL,
+                                          self.handler._timed_flush)
+            self.assertEqual(self.read(), "")
+            # Timer firing
+            timer.call_args[0][1]()
+            self.assertEqual(self.read(), "first\nsecond\n")
+            # Once fired, a new record starts a new timer
+            self.handler.handle(self.record("third"))
+            self.assertEqual(timer.call_count, 2)
+
+    def test_flush_on_warning(self):
+        with patch("ragger.logger.threading.Timer") as timer:
+            self.handler.handle(self.record("debug"))
+            self.handler.handle(self.record("warning", level=logging.WARNING))
+            self.assertEqual(self.read(), "debug\nwarning\n")
+        timer.assert_called_once()
+
+    def test_close(self):
+        with patch("ragger.logger.threading.Timer") as timer:
+            self.handler.handle(self.record("pending"))
+            self.assertEqual(self.read(), "")
+            self.handler.close()
+            timer.return_value.cancel.assert_called_once()
+        self.assertEqual(self.read(), "pending\n")
+
+    def test_emit_after_close(self):
+        with patch("ragger.logger.threading.Timer") as timer:
+            self.handler.handle(self.record("one"))
+            self.handler.handle(self.record("two"))
+            self.handler.close()
+            # Late record: the log file is neither re-opened (truncated) nor flushed later
+            self.handler.handle(self.record("late"))
+            self.assertIsNone(self.handler.stream)
+            self.assertEqual(timer.call_count, 1)
+        self.assertEqual(self.read(), "one\ntwo\n")